@@ -37,11 +37,20 @@ echo
 echo "9. Probando análisis con Ollama directamente:"
 docker exec loginsights curl -s -X POST http://ollama:11434/api/generate \
   -H "Content-Type: application/json" \
-  -d '{"model":"tinyllama:1.1b","prompt":"Test: Say hello","stream":false}' | jq -r '.response // "No response"' 2>/dev/null || echo "No se puede conectar a Ollama"
+  -d '{"model":"tinyllama:1.1b-chat-v1-q4_K_M","prompt":"Test: Say hello","stream":false}' | jq -r '.response // "No response"' 2>/dev/null || echo "No se puede conectar a Ollama"
 echo
 
 echo "10. Mostrando un reporte reciente completo:"
-LATEST_REPORT=$(docker exec loginsights find /reports -name "summary_*.txt" -type f -printf '%T@ %p\n' 2>/dev/null | sort -n | tail -1 | awk '{print $2}')
+LATEST_REPORT=$(docker exec loginsights python3 -c '
+import os
+with os.scandir("/reports") as it:
+    latest = max(
+        (e for e in it if e.name.startswith("summary_") and e.name.endswith(".txt")),
+        key=lambda e: e.stat().st_mtime,
+        default=None,
+    )
+print(latest.path if latest else "")
+' 2>/dev/null)
 if [ -n "$LATEST_REPORT" ]; then
     echo "Reporte más reciente: $(basename $LATEST_REPORT)"
     echo "---"
@@ -4,7 +4,7 @@ set -e
 echo "🚀 Iniciando LogInsights..."
 
 : "${OLLAMA_HOST:=http://ollama:11434}"
-: "${MODEL:=tinyllama:1.1b}"
+: "${MODEL:=tinyllama:1.1b-chat-v1-q4_K_M}"
 : "${CONTAINER_NAMES:=moodle-app}"
 : "${INTERVAL:=120}"
 : "${ANALYSIS_TIMEOUT:=90}"
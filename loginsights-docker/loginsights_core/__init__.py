@@ -0,0 +1,10 @@
+"""
+loginsights_core - Módulos compartidos de LogInsights
+- config: configuración por variables de entorno
+- docker_utils: acceso al daemon de Docker (estado, logs, eventos)
+- ollama_client: llamadas a Ollama (warmup y análisis en lote)
+- reporter: escritura y listado de reportes en /reports
+"""
+from loginsights_core import config, docker_utils, ollama_client, reporter
+
+__all__ = ["config", "docker_utils", "ollama_client", "reporter"]
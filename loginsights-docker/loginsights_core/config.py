@@ -0,0 +1,24 @@
+"""
+Configuración de LogInsights vía variables de entorno
+"""
+import os
+
+OLLAMA_HOST = os.getenv("OLLAMA_HOST", "http://ollama:11434")
+# Tag cuantizado Q4_K_M explícito: mitad de ancho de banda de pesos por
+# token decodificado frente a FP16, con pérdida de calidad mínima
+MODEL        = os.getenv("MODEL", "tinyllama:1.1b-chat-v1-q4_K_M")
+INTERVAL     = int(os.getenv("INTERVAL", "120"))
+ANAL_TIMEOUT = int(os.getenv("ANALYSIS_TIMEOUT", "180"))
+CONTAINERS   = [c.strip() for c in os.getenv("CONTAINER_NAMES", "moodle-app").split(",")]
+LOG_LEVEL    = os.getenv("LOG_LEVEL", "INFO")
+# Cuántas peticiones simultáneas acepta Ollama (debe coincidir con el
+# OLLAMA_NUM_PARALLEL del servicio ollama en docker-compose)
+OLLAMA_PARALLEL = int(os.getenv("OLLAMA_NUM_PARALLEL", "3"))
+# Cada cuántos ciclos se analizan todos los contenedores aunque no hayan
+# emitido eventos (para que los reportes no envejezcan indefinidamente)
+REFRESH_CYCLES = int(os.getenv("REFRESH_CYCLES", "5"))
+
+# Tail máximo de logs (en bytes crudos) que se conserva para el prompt;
+# se trunca antes de decodificar para no pagar UTF-8 sobre bytes que
+# igual se descartarían (~16 KB ≈ 4k tokens)
+MAX_LOG_BYTES = 16_000
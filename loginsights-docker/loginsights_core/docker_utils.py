@@ -0,0 +1,81 @@
+"""
+Acceso al daemon de Docker: estado de contenedores, logs y eventos
+"""
+import threading
+import time
+
+import docker
+
+from loginsights_core.config import CONTAINERS, MAX_LOG_BYTES
+
+# ─────────────────────────  Cliente Docker  ─────────────────────────
+try:
+    docker_client = docker.DockerClient(base_url="unix:///var/run/docker.sock")
+    docker_client.ping()
+except Exception as exc:
+    print(f"❌ Error conectando a Docker: {exc}")
+    raise SystemExit(1)
+
+
+# ────────────────────────  Eventos de Docker  ───────────────────────
+# En lugar de analizar todos los contenedores en cada ciclo, un hilo
+# escucha el stream de eventos y marca como pendientes solo los que
+# cambiaron; el ciclo (cada INTERVAL) vacía ese conjunto.
+PENDING: set = set()
+PENDING_LOCK = threading.Lock()
+EVENT_STATUSES = {"start", "restart", "die", "oom"}
+
+
+def _watch_events() -> None:
+    while True:
+        try:
+            events = docker_client.events(
+                decode=True, filters={"type": "container", "container": CONTAINERS}
+            )
+            for ev in events:
+                if ev.get("status") in EVENT_STATUSES:
+                    name = ev.get("Actor", {}).get("Attributes", {}).get("name", "")
+                    if name in CONTAINERS:
+                        with PENDING_LOCK:
+                            PENDING.add(name)
+        except Exception as exc:
+            print(f"⚠️  Stream de eventos interrumpido: {exc}")
+            time.sleep(5)
+
+
+def start_event_watcher() -> None:
+    threading.Thread(target=_watch_events, daemon=True).start()
+
+
+def take_pending() -> set:
+    """Devuelve y vacía el conjunto de contenedores con eventos recientes."""
+    with PENDING_LOCK:
+        pending = set(PENDING)
+        PENDING.clear()
+    return pending
+
+
+# ────────────────────────  Estado y logs  ───────────────────────────
+def get_containers(names: list) -> dict:
+    """
+    Obtiene los objetos Container de todos los nombres pedidos con un
+    solo containers.list (un RPC por ciclo en vez de uno por contenedor);
+    estado y logs se leen de ellos sin repetir el roundtrip al socket.
+    """
+    try:
+        found = docker_client.containers.list(all=True, filters={"name": names})
+    except Exception as exc:
+        print(f"⚠️  Error listando contenedores: {exc}")
+        return {}
+    # el filtro "name" de Docker es por substring; se restringe al match exacto
+    return {c.name: c for c in found if c.name in names}
+
+
+def get_recent_logs(cont, lines: int = 100) -> str:
+    try:
+        # API de bajo nivel: evita el wrapper Container y trae solo el
+        # tail pedido; errors="replace" tolera bytes no UTF-8 sin fallar
+        raw = docker_client.api.logs(cont.id, tail=lines, timestamps=True)
+        return raw[-MAX_LOG_BYTES:].decode("utf-8", errors="replace")
+    except Exception as exc:
+        return f"Error obteniendo logs: {exc}"
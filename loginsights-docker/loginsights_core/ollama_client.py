@@ -0,0 +1,151 @@
+"""
+Cliente HTTP hacia Ollama: warmup del modelo y análisis en lote
+"""
+import re
+
+import orjson
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+from loginsights_core.config import ANAL_TIMEOUT, CONTAINERS, MODEL, OLLAMA_HOST
+
+# Plantilla estática del prompt: se construye una vez a nivel de módulo
+PROMPT_TMPL = """Analiza los siguientes logs del contenedor **{c}** y genera un resumen:
+
+1. Mensajes más relevantes
+2. Errores o advertencias críticas
+3. Estado general del servicio
+4. Acciones recomendadas
+
+Responde en español de forma breve y estructurada.
+
+Logs:
+{t}"""
+
+# ─────────────────────────  Sesión HTTP  ────────────────────────────
+# Una sola sesión con pool de conexiones: el TCP hacia Ollama se abre
+# una vez y se reutiliza en todas las peticiones concurrentes. El Retry
+# reintenta los 502/503/504 transitorios (p. ej. Ollama recargando el
+# modelo) para no perder el ciclo completo de un contenedor.
+SESSION = requests.Session()
+SESSION.mount(
+    "http://",
+    HTTPAdapter(
+        max_retries=Retry(
+            total=2,
+            backoff_factor=1,
+            status_forcelist=(502, 503, 504),
+            allowed_methods=None,  # reintentar también los POST
+        ),
+        pool_connections=len(CONTAINERS),
+        pool_maxsize=len(CONTAINERS),
+    ),
+)
+JSON_HEADERS = {"Content-Type": "application/json"}
+
+
+def warm_up_model() -> None:
+    """
+    Precarga el modelo en Ollama con keep_alive=-1 para que los pesos
+    queden residentes y el primer /api/generate del ciclo no pague la
+    carga en frío del modelo.
+    """
+    try:
+        SESSION.post(
+            f"{OLLAMA_HOST}/api/generate",
+            data=orjson.dumps({"model": MODEL, "keep_alive": -1}),
+            headers=JSON_HEADERS,
+            timeout=ANAL_TIMEOUT,
+        )
+        print(f"🔥 Modelo {MODEL} precargado en Ollama")
+    except Exception as exc:
+        print(f"⚠️  No se pudo precargar el modelo: {exc}")
+
+
+# El costo de prefill escala con los tokens del prompt: antes de llamar
+# al modelo se filtran solo las líneas de error/advertencia (más contexto)
+INTERESTING_RE = re.compile(r"\b(ERROR|WARN(ING)?|FATAL|CRITICAL|Exception|Traceback)\b", re.I)
+PROMPT_CONTEXT_LINES = 2
+MAX_PROMPT_CHARS = 2048
+
+
+def summarize_for_prompt(logs: str) -> str:
+    """
+    Reduce los logs a las líneas interesantes (error/warn/fatal/traceback)
+    con 2 líneas de contexto alrededor, acotado a 2 KB. Si no hay nada
+    interesante devuelve el tail, para que el modelo vea el comportamiento
+    "normal" del servicio.
+    """
+    lines = logs.splitlines()
+    keep = set()
+    for idx, line in enumerate(lines):
+        if INTERESTING_RE.search(line):
+            lo = max(0, idx - PROMPT_CONTEXT_LINES)
+            hi = min(len(lines), idx + PROMPT_CONTEXT_LINES + 1)
+            keep.update(range(lo, hi))
+    if keep:
+        selected = "\n".join(lines[i] for i in sorted(keep))
+    else:
+        selected = "\n".join(lines)
+    return selected[-MAX_PROMPT_CHARS:]
+
+
+def analyze_with_ollama(text: str, container: str, num_predict: int = None) -> tuple[str, bool]:
+    """
+    Llama a /api/generate de Ollama para análisis inteligente de logs.
+    Los logs se pre-filtran a las líneas interesantes antes de armar el
+    prompt; num_predict se deriva del tamaño filtrado si no se indica.
+
+    Devuelve (análisis, ok): ok es False si la llamada falló y el texto
+    es un mensaje de error en lugar de un análisis real.
+    """
+    text = summarize_for_prompt(text)
+    if num_predict is None:
+        num_predict = num_predict_for(text)
+    prompt = PROMPT_TMPL.format(c=container, t=text)
+
+    try:
+        payload = {
+            "model": MODEL,
+            "prompt": prompt,
+            "stream": False,
+            "keep_alive": -1,
+            "options": {
+                "temperature": 0.4,
+                "num_predict": num_predict,
+                # Contexto y batch de prefill fijados explícitamente para
+                # que Ollama no reserve más KV-cache del necesario; 2048
+                # es el contexto de entrenamiento de tinyllama y cubre de
+                # sobra el prompt filtrado (~700 tokens) + num_predict
+                "num_ctx": 2048,
+                "num_batch": 512
+            },
+        }
+        resp = SESSION.post(
+            f"{OLLAMA_HOST}/api/generate",
+            data=orjson.dumps(payload),
+            headers=JSON_HEADERS,
+            timeout=ANAL_TIMEOUT,
+        )
+        if resp.status_code == 200:
+            return orjson.loads(resp.content).get("response", "Respuesta vacía"), True
+        return f"Error {resp.status_code}: {resp.text}", False
+    except requests.exceptions.Timeout:
+        return "⏱️ Timeout alcanzado durante la llamada a Ollama", False
+    except Exception as exc:
+        return f"❌ Error llamando a Ollama: {exc}", False
+
+
+# Bins por tamaño del texto YA filtrado (acotado a MAX_PROMPT_CHARS):
+# num_predict acorde a la entrada, para que la respuesta no exceda lo
+# que hay que resumir. Umbrales en chars del dominio post-filtro.
+BATCH_BINS = ((512, 256), (1500, 384), (float("inf"), 512))
+
+
+def num_predict_for(text: str) -> int:
+    """Devuelve el num_predict del bin correspondiente al texto filtrado."""
+    for limit, num_predict in BATCH_BINS:
+        if len(text) < limit:
+            return num_predict
+    return BATCH_BINS[-1][1]
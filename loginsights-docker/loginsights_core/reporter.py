@@ -0,0 +1,81 @@
+"""
+Escritura en segundo plano y listado de reportes en /reports
+"""
+import os
+import queue
+import threading
+from collections import deque
+from datetime import datetime
+from pathlib import Path
+
+from loginsights_core.config import MODEL
+
+# Cola de reportes: el hilo escritor saca la escritura a disco del
+# camino crítico del ciclo de análisis (patrón "background writer")
+REPORT_Q: queue.Queue = queue.Queue()
+
+
+def _report_writer() -> None:
+    while True:
+        path, content = REPORT_Q.get()
+        try:
+            path.write_bytes(content)
+            print(f"✅ Reporte guardado: {path}")
+        except Exception as exc:
+            print(f"❌ Error escribiendo {path}: {exc}")
+        finally:
+            REPORT_Q.task_done()
+
+
+def start_report_writer() -> None:
+    threading.Thread(target=_report_writer, daemon=True).start()
+
+
+def flush_reports() -> None:
+    """Bloquea hasta que todos los reportes encolados estén en disco."""
+    REPORT_Q.join()
+
+
+def save_report(container: str, analysis: str, logs: str, status: str, now: datetime = None) -> None:
+    # Un único datetime.now() por reporte: el timestamp del nombre de
+    # archivo y el del encabezado quedan garantizados idénticos
+    if now is None:
+        now = datetime.now()
+    ts = now.strftime("%Y%m%d_%H%M%S")
+    path = Path(f"/reports/summary_{container}_{ts}.txt")
+
+    # Ring-buffer: solo las últimas 50 líneas quedan vivas en memoria,
+    # sin retener la lista completa de líneas del log
+    tail = deque(logs.splitlines(), maxlen=50)
+
+    parts = [
+        f"=== LogInsights - Análisis de logs para {container} ===",
+        f"Timestamp: {now.isoformat()}",
+        f"Estado del contenedor: {status}",
+        f"Modelo usado: {MODEL}",
+        "=" * 50,
+        "",
+        "=== ANÁLISIS ===",
+        analysis,
+        "",
+        "=== LOGS ORIGINALES (últimas 50 líneas) ===",
+        *tail,
+        "",
+    ]
+    REPORT_Q.put((path, "\n".join(parts).encode()))
+
+
+def list_last_reports() -> None:
+    if not os.path.isdir("/reports"):
+        return
+    # os.scandir entrega DirEntry con stat() cacheado: un solo syscall
+    # por archivo en lugar del stat extra que repetía Path.stat()
+    with os.scandir("/reports") as it:
+        reports = sorted(
+            (e for e in it if e.name.startswith("summary_") and e.name.endswith(".txt")),
+            key=lambda e: e.name,
+        )[-10:]
+    if reports:
+        print("\n📁 Últimos reportes:")
+        for rep in reports:
+            print(f"  • {rep.name} ({rep.stat().st_size/1024:.1f} KB)")
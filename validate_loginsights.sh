@@ -131,11 +131,11 @@ echo -e "${BLUE}5. CHECKING OLLAMA CONNECTIVITY${NC}"
 if docker exec loginsights curl -s http://ollama:11434/api/tags >/dev/null 2>&1; then
     check_pass "Ollama API is accessible"
     
-    MODEL_CHECK=$(docker exec loginsights curl -s http://ollama:11434/api/tags | grep -o '""' || echo "")
+    MODEL_CHECK=$(docker exec loginsights curl -s http://ollama:11434/api/tags | grep -o 'tinyllama:1.1b-chat-v1-q4_K_M' || echo "")
     if [ -n "$MODEL_CHECK" ]; then
-        check_pass "tinyllama:1.1b model is available"
+        check_pass "tinyllama:1.1b-chat-v1-q4_K_M model is available"
     else
-        check_fail "tinyllama:1.1b model not found"
+        check_fail "tinyllama:1.1b-chat-v1-q4_K_M model not found"
     fi
 else
     check_fail "Cannot connect to Ollama API"